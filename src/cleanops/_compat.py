@@ -0,0 +1,15 @@
+import pandas as pd
+
+# Copy-on-Write is always on from pandas 3.0, which deprecates the option.
+_PANDAS_3 = int(pd.__version__.split(".")[0]) >= 3
+
+
+def snapshot(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Copy the caller's frame so that in-place fixes never reach it.
+
+    Under Copy-on-Write a shallow copy is enough: the data is only copied
+    on the first write to either side. Without it (the pandas 2.x default)
+    this is a deep copy, as before.
+    """
+    copy_on_write = _PANDAS_3 or pd.get_option("mode.copy_on_write") is True
+    return dataframe.copy(deep=not copy_on_write)
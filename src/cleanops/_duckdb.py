@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._stats import timedeltas_as_float
+
+if TYPE_CHECKING:
+    import duckdb
+
+
+def connect(dataframe: pd.DataFrame) -> "duckdb.DuckDBPyConnection":
+    """Register the frame as table ``data`` with columns named c0, c1, ... by position.
+
+    Timedelta columns are registered as float counts of their unit (see
+    _stats.timedeltas_as_float); as INTERVALs they have no quantile_cont.
+    DuckDB cannot register a frame without columns; the scans below never
+    query the table in that case.
+    """
+    # Imported here rather than at module level: duckdb is optional and slow to import.
+    try:
+        import duckdb
+    except ImportError:
+        raise ImportError("backend='duckdb' requires duckdb: pip install 'cleanops[duckdb]'") from None
+    con = duckdb.connect()
+    if dataframe.shape[1]:
+        renamed = dataframe.set_axis([f"c{j}" for j in range(dataframe.shape[1])], axis=1)
+        con.register("data", timedeltas_as_float(renamed))
+    return con
+
+
+def missing_counts(con: "duckdb.DuckDBPyConnection", n_cols: int) -> List[int]:
+    """Null count of each column; DuckDB reads pandas NaN as NULL."""
+    if not n_cols:
+        return []
+    return list(con.execute(
+        "SELECT " + ", ".join(f"count(*) - count(c{j})" for j in range(n_cols)) + " FROM data"
+    ).fetchone())
+
+
+def repeat_counts(con: "duckdb.DuckDBPyConnection", dataframe: pd.DataFrame) -> List[int]:
+    """How many values in each column repeat an earlier one; nulls count as a value.
+
+    Object columns are counted in pandas: DuckDB casts mixed values to
+    VARCHAR, where 1 and '1' collide but 1 and 1.0 do not.
+    """
+    positions = [j for j, dtype in enumerate(dataframe.dtypes) if dtype != object]
+    found = {}
+    if positions:
+        found = dict(zip(positions, con.execute(
+            "SELECT " + ", ".join(
+                f"count(*) - count(DISTINCT c{j}) - (count(c{j}) < count(*))::INTEGER" for j in positions
+            ) + " FROM data"
+        ).fetchone()))
+    return [
+        found[j] if j in found else int(dataframe.iloc[:, j].duplicated().sum())
+        for j in range(dataframe.shape[1])
+    ]
+
+
+def iqr_outliers(con: "duckdb.DuckDBPyConnection", positions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """DuckDB counterpart of _stats.iqr_outliers for the columns at ``positions``.
+
+    Quartiles, fences and counts come from one query; quantile_cont is exact
+    and interpolates linearly, like Series.quantile.
+    """
+    if not len(positions):
+        return np.zeros(0, np.int64), np.empty(0), np.empty(0)
+    quartiles = ", ".join(f"quantile_cont(c{j}, [0.25, 0.75]) AS q{j}" for j in positions)
+    fences = ", ".join(
+        f"q{j}[1] - 1.5 * (q{j}[2] - q{j}[1]) AS lo{j}, q{j}[2] + 1.5 * (q{j}[2] - q{j}[1]) AS hi{j}"
+        for j in positions
+    )
+    counts = ", ".join(
+        f"coalesce(count_if(c{j} < lo{j} OR c{j} > hi{j}), 0), any_value(lo{j}), any_value(hi{j})" for j in positions
+    )
+    row = con.execute(
+        f"WITH q AS (SELECT {quartiles} FROM data), f AS (SELECT {fences} FROM q) "
+        f"SELECT {counts} FROM data, f"
+    ).fetchone()
+    return (
+        np.array(row[0::3], dtype=np.int64),
+        np.array(row[1::3], dtype=np.float64),
+        np.array(row[2::3], dtype=np.float64),
+    )
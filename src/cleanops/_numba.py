@@ -0,0 +1,18 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def count_outside(arr, lower, upper):
+    """Fused compare-and-count behind _stats.count_outside."""
+    n_rows, n_cols = arr.shape
+    counts = np.zeros(n_cols, np.int64)
+    for j in prange(n_cols):
+        lo, hi = lower[j], upper[j]
+        count = 0
+        for i in range(n_rows):
+            v = arr[i, j]
+            if v < lo or v > hi:
+                count += 1
+        counts[j] = count
+    return counts
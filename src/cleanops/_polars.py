@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._stats import timedeltas_as_float
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def to_polars(dataframe: pd.DataFrame) -> "pl.DataFrame":
+    """Convert to polars, naming columns by position so any pandas labels work.
+
+    Object columns whose values Arrow cannot give a single type (e.g. mixed
+    ints and strings) are left out; the counts below scan those in pandas.
+    Timedelta columns become float counts of their unit, see
+    _stats.timedeltas_as_float.
+    """
+    # Imported here rather than at module level: polars is optional and slow to import.
+    try:
+        import polars as pl
+    except ImportError:
+        raise ImportError("backend='polars' requires polars: pip install 'cleanops[polars]'") from None
+    renamed = timedeltas_as_float(dataframe.set_axis([str(j) for j in range(dataframe.shape[1])], axis=1))
+    try:
+        return pl.from_pandas(renamed)
+    except (ValueError, TypeError):  # pyarrow's ArrowInvalid / ArrowTypeError
+        pass
+    columns = []
+    for _, col in renamed.items():
+        try:
+            columns.append(pl.from_pandas(col))
+        except (ValueError, TypeError):
+            continue
+    return pl.DataFrame(columns)
+
+
+def _by_position(dataframe: pd.DataFrame, found: Dict[str, int], fallback: Callable[[pd.Series], int]) -> List[int]:
+    """One count per column position, using ``fallback`` for columns to_polars left out."""
+    return [
+        found[str(j)] if str(j) in found else int(fallback(dataframe.iloc[:, j]))
+        for j in range(dataframe.shape[1])
+    ]
+
+
+def missing_counts(frame: "pl.DataFrame", dataframe: pd.DataFrame) -> List[int]:
+    """Null count of each column (NaN is converted to null by to_polars)."""
+    found = dict(zip(frame.columns, frame.null_count().row(0))) if frame.width else {}
+    return _by_position(dataframe, found, lambda col: col.isna().sum())
+
+
+def repeat_counts(frame: "pl.DataFrame", dataframe: pd.DataFrame) -> List[int]:
+    """How many values in each column repeat an earlier one; nulls count as a value."""
+    import polars as pl  # already loaded by to_polars
+    found = dict(zip(frame.columns, (frame.height - n for n in frame.select(pl.all().n_unique()).row(0)))) if frame.width else {}
+    return _by_position(dataframe, found, lambda col: col.duplicated().sum())
+
+
+def iqr_outliers(frame: "pl.DataFrame", positions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Polars counterpart of _stats.iqr_outliers for the columns at ``positions``."""
+    if not len(positions):
+        return np.zeros(0, np.int64), np.empty(0), np.empty(0)
+    import polars as pl  # already loaded by to_polars
+    exprs = []
+    for j in positions:
+        col = pl.col(str(j))
+        q1, q3 = col.quantile(0.25, "linear"), col.quantile(0.75, "linear")
+        lower, upper = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        exprs += [
+            ((col < lower) | (col > upper)).sum().alias(f"count_{j}"),
+            lower.alias(f"lower_{j}"),
+            upper.alias(f"upper_{j}"),
+        ]
+    # One lazy query so polars can share the quantiles between expressions.
+    row = frame.lazy().select(exprs).collect().row(0)
+    counts = np.array(row[0::3], dtype=np.int64)
+    lower = np.array(row[1::3], dtype=np.float64)
+    upper = np.array(row[2::3], dtype=np.float64)
+    return counts, lower, upper
@@ -0,0 +1,137 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+
+# Below this many rows, thread start-up costs more than the per-column work.
+_PARALLEL_MIN_ROWS = 100_000
+
+
+def map_columns(func: Callable[[int], T], n_cols: int, n_rows: int) -> List[T]:
+    """Call ``func`` for each column position, in a thread pool on large frames.
+
+    Only worth it for work that releases the GIL (NumPy selection, Arrow
+    kernels, numba ``nogil`` functions).
+    """
+    if n_rows < _PARALLEL_MIN_ROWS or n_cols < 2 or (os.cpu_count() or 1) < 2:
+        return [func(j) for j in range(n_cols)]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(func, range(n_cols)))
+
+
+def numeric_block(dataframe: pd.DataFrame, columns: Optional[pd.Index] = None) -> Tuple[pd.Index, np.ndarray]:
+    """Return the numeric column labels and their values as one 2-D float array.
+
+    Pass ``columns`` when the numeric labels are already known to skip the
+    dtype scan.
+
+    The block is float32 when every numeric column fits in it exactly
+    (float32, float16, and 8/16-bit integers), which halves the memory
+    traffic of the statistics; otherwise it is float64.
+    """
+    numeric = dataframe.select_dtypes(include="number") if columns is None else dataframe[columns]
+    dtypes = [getattr(dtype, "numpy_dtype", dtype) for dtype in numeric.dtypes]
+    narrow = bool(dtypes) and all(np.can_cast(dtype, np.float32, "safe") for dtype in dtypes)
+    arr = numeric.to_numpy(dtype=np.float32 if narrow else np.float64, na_value=np.nan)
+    # pandas 2.x ignores na_value for NaT and casts it to its int64 sentinel.
+    for j in np.flatnonzero([dtype.kind == "m" for dtype in dtypes]):
+        arr[numeric.iloc[:, j].isna().to_numpy(), j] = np.nan
+    return numeric.columns, arr
+
+
+def timedeltas_as_float(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Swap timedelta64 columns for float counts of their own unit, NaT as NaN.
+
+    These are the values numeric_block scans; the polars and DuckDB backends
+    use them instead of their Duration/INTERVAL types so their quartiles and
+    fences come out in the same unit. Column labels must be unique.
+    """
+    td_cols = [col for col, dtype in dataframe.dtypes.items() if isinstance(dtype, np.dtype) and dtype.kind == "m"]
+    if not td_cols:
+        return dataframe
+    _, arr = numeric_block(dataframe, pd.Index(td_cols))
+    dataframe = dataframe.copy(deep=False)
+    dataframe[td_cols] = arr
+    return dataframe
+
+
+def _row_hashes(dataframe: pd.DataFrame) -> pd.Series:
+    """One uint64 hash per row, with -0.0 and every NaN bit pattern hashed alike."""
+    float_cols = dataframe.select_dtypes(include="floating").columns
+    if len(float_cols):
+        dataframe = dataframe.copy(deep=False)
+        floats = dataframe[float_cols]
+        dataframe[float_cols] = floats.where(floats.notna(), np.nan) + 0.0
+    return pd.util.hash_pandas_object(dataframe, index=False)
+
+
+def duplicate_row_count(dataframe: pd.DataFrame) -> int:
+    """Count rows that repeat an earlier row, from one uint64 hash per row.
+
+    Object columns are hashed through their string form, so 1 and '1'
+    would collide; frames with any object column use drop_duplicates.
+    """
+    if dataframe.shape[1] == 0:
+        return 0
+    if (dataframe.dtypes == object).any():
+        return len(dataframe) - len(dataframe.drop_duplicates())
+    hashes = _row_hashes(dataframe)
+    return len(hashes) - hashes.nunique()
+
+
+def iqr_bounds(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-column IQR fences (Q1 - 1.5*IQR, Q3 + 1.5*IQR), ignoring NaN.
+
+    Quartiles use the same linear interpolation as Series.quantile. All-NaN
+    columns get NaN fences.
+    """
+    if not arr.size:  # np.nanquantile drops the quartile axis on empty input
+        return np.full(arr.shape[1], np.nan), np.full(arr.shape[1], np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0).astype(np.float64)
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def sigma_bounds(arr: np.ndarray, k: float = 3.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-column mean -/+ k sample standard deviations, ignoring NaN."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(arr, axis=0)
+        std = np.nanstd(arr, axis=0, ddof=1)
+    return mean - k * std, mean + k * std
+
+
+def count_outside(arr: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Count values strictly outside [lower, upper] in each column.
+
+    Uses the numba kernel when installed, which compares and counts in one
+    pass without the two boolean temporaries.
+    """
+    kernels = _numba_kernels()
+    if kernels is not None and arr.size:
+        return kernels.count_outside(arr, np.asarray(lower, np.float64), np.asarray(upper, np.float64))
+    return ((arr < lower) | (arr > upper)).sum(axis=0)
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """The numba kernels in cleanops._numba, imported on first use (numba is slow to import)."""
+    try:
+        from . import _numba
+    except ImportError:  # numba is optional; the NumPy path above is always available
+        return None
+    return _numba
+
+
+def iqr_outliers(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-column IQR outlier counts and the (lower, upper) fences they used."""
+    lower, upper = iqr_bounds(arr)
+    return count_outside(arr, lower, upper), lower, upper
@@ -1,5 +1,7 @@
+import mmap
 import pandas as pd
 from pathlib import Path
+from typing import Optional, Union
 
 
 class DataGetter:
@@ -8,21 +10,61 @@ class DataGetter:
     def __init__(self, base_path: str = ".") -> None:
         self._base_path = Path(base_path)
 
-    def read_file(self, file_name: str, encoding: str = "utf-8") -> str:
-        """Read a text file and return its content."""
+    def _resolve(self, file_name: str) -> Path:
         file_path = self._base_path / file_name
         if not file_path.exists():
             raise FileNotFoundError(f"'{file_name}' not found in '{self._base_path}'")
-        return file_path.read_text(encoding=encoding)
+        return file_path
+
+    def read_file(self, file_name: str, encoding: Optional[str] = "utf-8") -> Union[str, bytes]:
+        """Read a text file and return its content; ``encoding=None`` returns raw bytes."""
+        if encoding is None:
+            return self.read_bytes(file_name)
+        return self._resolve(file_name).read_text(encoding=encoding)
+
+    def read_bytes(self, file_name: str, memory_map: bool = False) -> Union[bytes, mmap.mmap]:
+        """Read a file's raw bytes without decoding them.
+
+        With ``memory_map=True`` a read-only ``mmap.mmap`` is returned, so
+        large files are paged in on demand instead of copied into memory.
+        It supports slicing and ``find``; close it when done.
+        """
+        file_path = self._resolve(file_name)
+        if memory_map and file_path.stat().st_size:
+            with open(file_path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return file_path.read_bytes()
 
     def read_csv(self, file_name: str) -> pd.DataFrame:
-        """Read a CSV file and return a DataFrame."""
-        file_path = self._base_path / file_name
-        if not file_path.exists():
-            raise FileNotFoundError(f"'{file_name}' not found in '{self._base_path}'")
-        return pd.read_csv(file_path)
+        """Read a CSV file and return a DataFrame.
+
+        With pyarrow installed the file is memory-mapped and parsed by
+        pyarrow's multi-threaded reader into Arrow-backed columns, so string
+        reductions run in Arrow's C++ kernels instead of on Python objects.
+        Files ending in .parquet or .feather are read with the matching
+        reader instead.
+        """
+        file_path = self._resolve(file_name)
+        suffix = file_path.suffix.lower()
+        if suffix == ".parquet":
+            return self.read_parquet(file_name)
+        if suffix == ".feather":
+            return self.read_feather(file_name)
+        try:
+            import pyarrow
+        except ImportError:  # pyarrow is optional; pandas' own parser is used instead
+            return pd.read_csv(file_path, memory_map=True)
+        with pyarrow.memory_map(str(file_path)) as source:
+            return pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+
+    def read_parquet(self, file_name: str) -> pd.DataFrame:
+        """Read a Parquet file into Arrow-backed columns (requires pyarrow)."""
+        return pd.read_parquet(self._resolve(file_name), engine="pyarrow", dtype_backend="pyarrow")
+
+    def read_feather(self, file_name: str) -> pd.DataFrame:
+        """Read a Feather file into Arrow-backed columns (requires pyarrow)."""
+        return pd.read_feather(self._resolve(file_name), dtype_backend="pyarrow")
 
     def __repr__(self) -> str:
         return f"<DataGetter base_path='{self._base_path}'>"
 
-
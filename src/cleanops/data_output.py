@@ -1,22 +1,74 @@
 import pandas as pd
 import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, Iterable, Optional
+
+from ._compat import snapshot
+from ._stats import numeric_block, sigma_bounds, count_outside, duplicate_row_count
 
 
 class DataExporter:
-    """Export DataFrame in CSV, Excel, or JSON formats."""
+    """Export DataFrame in CSV, Excel, JSON, Parquet, or Feather formats."""
 
     def __init__(self, dataframe: pd.DataFrame) -> None:
-        self._data = dataframe.copy()
-
-    def to_csv(self, file_name: str = "cleaned_data.csv") -> None:
-        self._data.to_csv(file_name, index=False)
+        self._data = snapshot(dataframe)
+
+    def to_csv(self, file_name: str = "cleaned_data.csv", engine: str = "pandas") -> None:
+        """Write a CSV file.
+
+        ``engine="pyarrow"`` uses pyarrow's multi-threaded writer. It is
+        faster on large frames but formats values differently from pandas
+        (e.g. ``1`` for the float ``1.0``, ``true`` for ``True``, quoted
+        headers), so it is opt-in.
+        """
+        if engine not in ("pandas", "pyarrow"):
+            raise ValueError("engine must be 'pandas' or 'pyarrow'")
+        if engine == "pyarrow":
+            # Imported here: pyarrow is optional, and pyarrow.csv is slow to load.
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pa_csv
+            except ImportError:
+                raise ImportError("engine='pyarrow' requires pyarrow: pip install 'cleanops[arrow]'") from None
+            try:
+                table = pa.Table.from_pandas(self._data, preserve_index=False)
+            except pa.ArrowException:
+                pass  # e.g. mixed-type object columns; let pandas handle them
+            else:
+                pa_csv.write_csv(table, file_name)
+                return
+        self._data.to_csv(file_name, index=False, chunksize=100_000)
+
+    def _arrow_compatible(self) -> bool:
+        """Whether pyarrow is installed and can type every column.
+
+        Object columns mixing e.g. ints and strings have no Arrow type.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:  # pyarrow is optional; only needed for Parquet and Feather
+            return False
+        try:
+            pa.Schema.from_pandas(self._data, preserve_index=False)
+        except pa.ArrowException:
+            return False
+        return True
 
     def to_excel(self, file_name: str = "cleaned_data.xlsx") -> None:
         self._data.to_excel(file_name, index=False)
 
     def to_json(self, file_name: str = "cleaned_data.json") -> None:
-        self._data.to_json(file_name, orient="records", indent=4)
+        """Write newline-delimited JSON (NDJSON): one record object per line."""
+        self._data.to_json(file_name, orient="records", lines=True, date_format="iso")
+
+    def to_parquet(self, file_name: str = "cleaned_data.parquet") -> None:
+        """Write a zstd-compressed Parquet file (requires pyarrow)."""
+        self._data.to_parquet(file_name, engine="pyarrow", compression="zstd", index=False)
+
+    def to_feather(self, file_name: str = "cleaned_data.feather") -> None:
+        """Write an lz4-compressed Feather file (requires pyarrow)."""
+        self._data.reset_index(drop=True).to_feather(file_name, compression="lz4")
 
     def __repr__(self) -> str:
         return f"<DataExporter columns={self._data.shape[1]}>"
@@ -26,18 +78,20 @@ class ReportGenerator:
     """Create a summary report of dataset issues such as missing values, duplicates, and outliers."""
 
     def __init__(self, dataframe: pd.DataFrame) -> None:
-        self._data = dataframe.copy()
+        self._data = snapshot(dataframe)
         self._report_data: Dict[str, Any] = {}
         self._score: int = 0
 
+    @cached_property
+    def _numeric_cols(self) -> pd.Index:
+        return self._data.select_dtypes(include="number").columns
+
     def report(self) -> Dict[str, Any]:
         missing = self._data.isnull().sum().to_dict()
-        duplicates = self._data.duplicated().sum()
-        outliers: Dict[str, int] = {}
-        for col in self._data.select_dtypes(include="number").columns:
-            mean = self._data[col].mean()
-            std = self._data[col].std()
-            outliers[col] = int(((self._data[col] < mean - 3*std) | (self._data[col] > mean + 3*std)).sum())
+        duplicates = duplicate_row_count(self._data)
+        numeric_cols, arr = numeric_block(self._data, self._numeric_cols)
+        lower, upper = sigma_bounds(arr, k=3)
+        outliers: Dict[str, int] = dict(zip(numeric_cols, count_outside(arr, lower, upper).tolist()))
 
         self._report_data = {"missing": missing, "duplicates": duplicates, "outliers": outliers}
         return self._report_data
@@ -47,9 +101,18 @@ class ReportGenerator:
         if not self._report_data:
             self.report()
 
+        text = "".join(f"{key.upper()}:\n{value}\n\n" for key, value in self._report_data.items())
+        with open(file_name, "w", buffering=1 << 20) as f:
+            f.write(text)
+
+    def export_report_json(self, file_name: str = "report.json") -> None:
+        """Export the data report to a JSON file."""
+        if not self._report_data:
+            self.report()
+
         with open(file_name, "w") as f:
-            for key, value in self._report_data.items():
-                f.write(f"{key.upper()}:\n{value}\n\n")
+            # NumPy scalars are not JSON serializable; unwrap them to Python values.
+            json.dump(self._report_data, f, default=lambda value: value.item())
 
     def __repr__(self) -> str:
         return "<ReportGenerator>"
@@ -63,10 +126,27 @@ class DataOutput:
         self.exporter = DataExporter(dataframe)
         self.reporter = ReportGenerator(dataframe)
 
-    def export_all(self) -> None:
-        self.exporter.to_csv()
-        self.exporter.to_excel()
-        self.exporter.to_json()
+    def export_all(self, formats: Optional[Iterable[str]] = None) -> None:
+        """Write one file per format concurrently: csv, parquet, feather, json, or excel.
+
+        By default this writes CSV, plus Parquet when pyarrow is installed and
+        can store every column. Excel is opt-in because openpyxl writes it
+        cell by cell.
+        """
+        if formats is None:
+            formats = ("csv", "parquet") if self.exporter._arrow_compatible() else ("csv",)
+        writers = []
+        for fmt in formats:
+            writer = getattr(self.exporter, f"to_{fmt}", None)
+            if writer is None:
+                raise ValueError(f"Unsupported export format '{fmt}'")
+            writers.append(writer)
+        if not writers:
+            return
+        with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+            futures = [pool.submit(writer) for writer in writers]
+        for future in futures:
+            future.result()
 
     def generate_report(self) -> None:
         self.reporter.report()
@@ -1,5 +1,7 @@
 from typing import Optional, Any
 
+from .data_output import DataExporter, DataOutput
+
 class DataPipeline:
     """Chain cleaning, visualization, and export steps."""
 
@@ -15,7 +17,9 @@ class DataPipeline:
 
     def run(self) -> None:
         print("=== Diagnosing Issues ===")
-        for col, msgs in self.cleaner.diagnose().items():
+        # One scan is shared by the diagnosis and the first fix in treat().
+        issues = self.cleaner.inspect()
+        for col, msgs in self.cleaner.diagnose(issues).items():
             for msg in msgs:
                 print(f"- {col}: {msg}")
 
@@ -27,9 +31,16 @@ class DataPipeline:
 
         if self.exporter:
             print("\n=== Exporting Cleaned Data ===")
-            self.exporter.to_csv()
-            self.exporter.to_excel()
-            self.exporter.to_json()
+            # A DataOutput or a DataExporter writes the three files concurrently
+            # through export_all; any other exporter is called method by method.
+            if isinstance(self.exporter, DataOutput):
+                self.exporter.export_all(formats=("csv", "excel", "json"))
+            elif isinstance(self.exporter, DataExporter):
+                DataOutput(self.exporter._data).export_all(formats=("csv", "excel", "json"))
+            else:
+                self.exporter.to_csv()
+                self.exporter.to_excel()
+                self.exporter.to_json()
 
         if self.reporter:
             self.reporter.report()
@@ -1,32 +1,72 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 
+from . import _duckdb, _polars
+from ._compat import snapshot
+from ._stats import numeric_block, iqr_bounds, iqr_outliers, map_columns
+
+if TYPE_CHECKING:
+    import duckdb
+    import polars as pl
 
-class DataInspector:
-    """Scan dataset and identify common data quality issues."""
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
-        self._data = dataframe.copy()
+class DataInspector:
+    """Scan dataset and identify common data quality issues.
+
+    With ``backend="polars"`` or ``backend="duckdb"`` the scans run in that
+    library's multi-threaded engine; the data itself, and every fix, stays
+    in pandas.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, backend: str = "pandas") -> None:
+        if backend not in ("pandas", "polars", "duckdb"):
+            raise ValueError("backend must be 'pandas', 'polars', or 'duckdb'")
+        self._data = snapshot(dataframe)
+        self._backend = backend
         self._issues: Dict[str, Any] = {}
+        self._inspect_dirty: bool = True
+        self._bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
-    def inspect(self) -> Dict[str, Any]:
-        """Run all inspections and return issues."""
+    def inspect(self, refresh: bool = False) -> Dict[str, Any]:
+        """Run all inspections and return issues.
+
+        Results are cached until the data is modified by a fix; pass
+        ``refresh=True`` to rescan after changing the frame externally.
+        """
+        if not self._inspect_dirty and not refresh:
+            return self._issues
         self._issues['missing'] = self.detect_missing()
         self._issues['duplicates'] = self.detect_duplicates()
         self._issues['outliers'] = self.detect_outliers()
+        self._inspect_dirty = False
         return self._issues
 
     def detect_missing(self) -> pd.Series:
-        return self._data.isnull().sum()
+        if self._backend == "polars":
+            counts = _polars.missing_counts(self._polars_frame, self._data)
+            return pd.Series(counts, index=self._data.columns, dtype="int64")
+        if self._backend == "duckdb":
+            counts = _duckdb.missing_counts(self._duckdb_conn, self._data.shape[1])
+            return pd.Series(counts, index=self._data.columns, dtype="int64")
+        # Most columns of a typical frame have no nulls; only sum the ones that do.
+        mask = self._data.isnull()
+        return mask.loc[:, mask.any()].sum().reindex(self._data.columns, fill_value=0).astype("int64")
 
     def detect_duplicates(self) -> dict:
         """
         Return a dictionary showing duplicate counts for each column.
         """
         dup_info = {}
-
-        for col in self._data.columns:
-            dup_count = self._data[col].duplicated().sum()
+        if self._backend == "polars":
+            dup_counts = pd.Series(_polars.repeat_counts(self._polars_frame, self._data), index=self._data.columns)
+        elif self._backend == "duckdb":
+            dup_counts = pd.Series(_duckdb.repeat_counts(self._duckdb_conn, self._data), index=self._data.columns)
+        else:
+            dup_counts = pd.Series([col.duplicated().sum() for _, col in self._data.items()], index=self._data.columns)
+
+        for col, dup_count in dup_counts.items():
             if dup_count > 0:
                 dup_info[col] = f"{dup_count} duplicate values"
 
@@ -34,15 +74,43 @@ class DataInspector:
 
 
     def detect_outliers(self) -> Dict[str, int]:
-        outliers: Dict[str, int] = {}
-        numeric_cols = self._data.select_dtypes(include="number").columns
-        for col in numeric_cols:
-            Q1, Q3 = self._data[col].quantile([0.25, 0.75])
-            IQR = Q3 - Q1
-            lower, upper = Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
-            count = ((self._data[col] < lower) | (self._data[col] > upper)).sum()
-            outliers[col] = int(count)
-        return outliers
+        numeric_cols = self._numeric_cols
+        # Three or fewer values can never fall outside their own IQR fences.
+        if numeric_cols.empty or len(self._data) < 4:
+            self._bounds = None
+            return dict.fromkeys(numeric_cols, 0)
+        if self._backend in ("polars", "duckdb"):
+            positions = np.flatnonzero(self._data.columns.isin(numeric_cols))
+            if self._backend == "polars":
+                counts, lower, upper = _polars.iqr_outliers(self._polars_frame, positions)
+            else:
+                counts, lower, upper = _duckdb.iqr_outliers(self._duckdb_conn, positions)
+        else:
+            numeric_cols, arr = numeric_block(self._data, numeric_cols)
+            counts, lower, upper = iqr_outliers(arr)
+        # Kept for fix_outliers, which clips to the same fences while the data is unchanged.
+        self._bounds = (lower, upper)
+        return dict(zip(numeric_cols, counts.tolist()))
+
+    @cached_property
+    def _numeric_cols(self) -> pd.Index:
+        return self._data.select_dtypes(include="number").columns
+
+    @cached_property
+    def _polars_frame(self) -> "pl.DataFrame":
+        return _polars.to_polars(self._data)
+
+    @cached_property
+    def _duckdb_conn(self) -> "duckdb.DuckDBPyConnection":
+        return _duckdb.connect(self._data)
+
+    def _invalidate(self) -> None:
+        """Drop results cached from the data after it has been modified."""
+        self._inspect_dirty = True
+        self._bounds = None
+        self.__dict__.pop("_numeric_cols", None)
+        self.__dict__.pop("_polars_frame", None)
+        self.__dict__.pop("_duckdb_conn", None)
 
     def get_summary(self) -> Dict[str, Any]:
         return self._issues
@@ -51,19 +119,31 @@ class DataInspector:
         return f"<DataInspector rows={self._data.shape[0]}, cols={self._data.shape[1]}>"
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, DataInspector) and self._data.equals(other._data)
+        # Shape and dtypes rule out most unequal frames before the full
+        # element-wise comparison.
+        return (
+            isinstance(other, DataInspector)
+            and self._data.shape == other._data.shape
+            and list(self._data.dtypes) == list(other._data.dtypes)
+            and self._data.equals(other._data)
+        )
 
 
 class DataCleaner(DataInspector):
     """Clean data: handle missing values, duplicates, and outliers."""
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
-        super().__init__(dataframe)
+    def __init__(self, dataframe: pd.DataFrame, backend: str = "pandas") -> None:
+        super().__init__(dataframe, backend)
         self._fix_log: list[str] = []
 
-    def diagnose(self) -> Dict[str, list[str]]:
-        """Return a dictionary of issues and suggested fixes."""
-        issues = self.inspect()
+    def diagnose(self, issues: Optional[Dict[str, Any]] = None) -> Dict[str, list[str]]:
+        """Return a dictionary of issues and suggested fixes.
+
+        Pass the result of a previous ``inspect()`` call as ``issues`` to
+        reuse it instead of scanning again.
+        """
+        if issues is None:
+            issues = self.inspect()
         suggestions: Dict[str, list[str]] = {}
 
         # Missing values
@@ -102,64 +182,115 @@ class DataCleaner(DataInspector):
 
     def fix_missing(self, strategy: str = "mean") -> None:
         """Fill missing values using a strategy: mean, median, or mode."""
-        for col in self._data.columns:
-            if self._data[col].isnull().sum() == 0:
-                continue
-
-            if pd.api.types.is_numeric_dtype(self._data[col]):
-                if strategy == "mean":
-                    fill_value = self._data[col].mean()
-                elif strategy == "median":
-                    fill_value = self._data[col].median()
-                else:
-                    raise ValueError("strategy must be 'mean' or 'median'")
-            else:
-                mode_val = self._data[col].mode()
-                fill_value = mode_val[0] if not mode_val.empty else "Unknown"
+        # Reuse the null counts from inspect() if the data has not changed since.
+        missing = self.detect_missing() if self._inspect_dirty else self._issues['missing']
+        self._invalidate()
+        missing_cols = missing.index[missing > 0]
+        if missing_cols.empty:
+            return
 
-            self._data[col] = self._data[col].fillna(fill_value)
-            self._fix_log.append(f"Filled missing '{col}' with {fill_value}")
+        # is_numeric_dtype, unlike select_dtypes("number"), leaves timedelta
+        # columns to the mode fill below.
+        numeric = self._data[[col for col in missing_cols if pd.api.types.is_numeric_dtype(self._data.dtypes[col])]]
+        other = self._data[missing_cols.difference(numeric.columns, sort=False)]
+
+        if numeric.empty:
+            num_fill = pd.Series(dtype=float)
+        elif strategy == "mean":
+            num_fill = numeric.mean()
+        elif strategy == "median":
+            num_fill = numeric.median()
+        else:
+            raise ValueError("strategy must be 'mean' or 'median'")
+        # Nullable and Arrow integer columns only accept whole fill values.
+        # (select_dtypes("integer") would also pick up timedelta64 columns.)
+        int_cols = [col for col, dtype in numeric.dtypes.items() if pd.api.types.is_integer_dtype(dtype)]
+        int_fill = num_fill[int_cols].dropna().round().astype("int64")
+
+        def first_mode(j: int) -> Any:
+            modes = other.iloc[:, j].mode(dropna=True)
+            return modes.iloc[0] if len(modes) else "Unknown"
+
+        cat_fill = dict(zip(other.columns, map_columns(first_mode, other.shape[1], other.shape[0])))
+
+        fill_values = {**num_fill.to_dict(), **int_fill.to_dict(), **cat_fill}
+        self._data.fillna(fill_values, inplace=True)
+        for col in missing_cols:
+            self._fix_log.append(f"Filled missing '{col}' with {fill_values[col]}")
 
     def fix_duplicates(self, column: str = None) -> None:
-        # Case 1: Specific column provided
         if column:
-            before = self._data.shape[0]
-            self._data.drop_duplicates(subset=[column], inplace=True)
-            removed = before - self._data.shape[0]
+            columns = [column]
+        else:
+            # Reuse the duplicate scan from inspect() if the data has not changed since.
+            columns = list(self.detect_duplicates() if self._inspect_dirty else self._issues['duplicates'])
+        self._invalidate()
+
+        # Narrow one row mask column by column and take the survivors once at
+        # the end, instead of copying the whole frame per drop_duplicates.
+        keep = np.ones(len(self._data), dtype=bool)
+        for col in columns:
+            survivors = np.flatnonzero(keep)
+            repeated = self._data[col].iloc[survivors].duplicated().to_numpy()
+            keep[survivors[repeated]] = False
 
             self._fix_log.append(
-                f"Removed {removed} duplicate rows based on column '{column}'"
+                f"Removed {int(repeated.sum())} duplicate rows based on column '{col}'"
             )
-            return
-
-        # Case 2: No column provided — auto detect duplicates
-        duplicate_cols = [
-            col for col in self._data.columns
-            if self._data[col].duplicated().sum() > 0
-        ]
 
-        for col in duplicate_cols:
-            before = self._data.shape[0]
-            self._data.drop_duplicates(subset=[col], inplace=True)
-            removed = before - self._data.shape[0]
-
-            self._fix_log.append(
-                f"Removed {removed} duplicate rows based on column '{col}'"
-            )
+        self._data = self._data[keep]
 
 
     def fix_outliers(self, strategy: str = "clip") -> None:
         """Handle outliers using strategy. Currently only 'clip' is supported."""
-        numeric_cols = self._data.select_dtypes(include="number").columns
+        bounds = self._bounds  # fences from detect_outliers, if the data is unchanged since
+        self._invalidate()
+        numeric_cols, arr = numeric_block(self._data, self._numeric_cols)
+        if numeric_cols.empty:
+            return
+        if strategy != "clip":
+            raise ValueError("strategy must be 'clip' for now")
+
+        lower, upper = bounds if bounds is not None else iqr_bounds(arr)
+        numeric = self._data[numeric_cols]
+        if all(dtype == arr.dtype for dtype in numeric.dtypes):
+            # Plain NumPy floats of the block's own dtype: clip the whole block
+            # in one fused pass. NaN fences (all-NaN columns) become open bounds.
+            lower = np.where(np.isnan(lower), -np.inf, lower).astype(arr.dtype)
+            upper = np.where(np.isnan(upper), np.inf, upper).astype(arr.dtype)
+            self._data[numeric_cols] = np.clip(arr, lower, upper)
+        else:
+            self._data[numeric_cols] = self._clip_columns(numeric, lower, upper)
         for col in numeric_cols:
-            Q1, Q3 = self._data[col].quantile([0.25, 0.75])
-            IQR = Q3 - Q1
-            lower, upper = Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
-            if strategy == "clip":
-                self._data[col] = self._data[col].clip(lower=lower, upper=upper)
-                self._fix_log.append(f"Clipped outliers in '{col}'")
-            else:
-                raise ValueError("strategy must be 'clip' for now")
+            self._fix_log.append(f"Clipped outliers in '{col}'")
+
+    @staticmethod
+    def _clip_columns(numeric: pd.DataFrame, lower: np.ndarray, upper: np.ndarray) -> pd.DataFrame:
+        """Clip mixed-dtype numeric columns to per-column bounds with DataFrame.clip."""
+        lower = pd.Series(lower, index=numeric.columns)
+        upper = pd.Series(upper, index=numeric.columns)
+        # Nullable and Arrow integer columns cannot hold fractional fences;
+        # rounding the fences inwards clips them to the same integers.
+        ext_int_cols = [
+            col for col, dtype in numeric.dtypes.items()
+            if isinstance(dtype, pd.api.extensions.ExtensionDtype) and pd.api.types.is_integer_dtype(dtype)
+        ]
+        lower[ext_int_cols] = np.ceil(lower[ext_int_cols])
+        upper[ext_int_cols] = np.floor(upper[ext_int_cols])
+        # Timedelta fences are in the column's own unit; they cannot be compared
+        # as floats, so those columns are clipped one by one to Timedelta bounds.
+        td_cols = numeric.select_dtypes(include="timedelta").columns
+        plain = numeric.drop(columns=td_cols)
+        clipped = plain.clip(lower=lower[plain.columns], upper=upper[plain.columns], axis=1)
+        for col in td_cols:
+            unit = np.datetime_data(numeric[col].dtype)[0]
+            clipped[col] = numeric[col].clip(
+                lower=pd.Timedelta(np.ceil(lower[col]), unit), upper=pd.Timedelta(np.floor(upper[col]), unit)
+            )
+        clipped = clipped[numeric.columns]
+        # The float64 bounds would otherwise upcast float32 columns.
+        float_cols = numeric.select_dtypes(include="floating").columns
+        return clipped.astype(numeric.dtypes[float_cols].to_dict())
 
     def get_fix_log(self) -> list[str]:
         return self._fix_log
@@ -172,7 +303,7 @@ class DataOrganizer:
     """Sort DataFrame columns or rows alphabetically."""
 
     def __init__(self, dataframe: pd.DataFrame):
-        self._data = dataframe.copy()
+        self._data = snapshot(dataframe)
 
     def sort_columns(self) -> pd.DataFrame:
         """Sort columns alphabetically."""
@@ -193,4 +324,9 @@ class DataOrganizer:
         return len(self._data)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, DataOrganizer) and self._data.equals(other._data)
+        return (
+            isinstance(other, DataOrganizer)
+            and self._data.shape == other._data.shape
+            and list(self._data.dtypes) == list(other._data.dtypes)
+            and self._data.equals(other._data)
+        )